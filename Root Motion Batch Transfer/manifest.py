@@ -0,0 +1,227 @@
+import bpy
+import hashlib
+import json
+import os
+import time
+from array import array
+from .properties import get_controller_names, invalidate_controller_index
+
+MANIFEST_VERSION = 1
+
+# Action statuses written to the manifest
+STATUS_PENDING = "pending"
+STATUS_RUNNING = "running"
+STATUS_DONE = "done"
+STATUS_FAILED = "failed"
+
+def manifest_path():
+    """
+    Returns: path of the sidecar manifest next to the saved .blend file, or in the temp dir if the file is unsaved.
+    """
+    if bpy.data.filepath:
+        return f"{os.path.splitext(bpy.data.filepath)[0]}.rmt_manifest.json"
+    return os.path.join(bpy.app.tempdir, "rmt_manifest.json")
+
+def journal_path(path):
+    """
+    Returns: path of the journal holding per-action updates made since the manifest was last written.
+    """
+    return f"{os.path.splitext(path)[0]}.jsonl"
+
+def action_fingerprint(action):
+    """
+    Hashes the F-Curve paths and keyframe coordinates of an action, so we can tell a pristine
+    source from a transferred one after a crash.
+    """
+    digest = hashlib.sha1()
+    for fcurve in action.fcurves:
+        digest.update(f"{fcurve.data_path}[{fcurve.array_index}]".encode())
+
+        coords = array('f', [0.0]) * (len(fcurve.keyframe_points) * 2)
+        fcurve.keyframe_points.foreach_get("co", coords)
+        digest.update(coords.tobytes())
+
+    return digest.hexdigest()
+
+def job_settings(scene):
+    rig = scene.rmt_selected_rig
+    return {
+        "rig": rig.name if rig else "",
+        "controllers": list(get_controller_names(scene)),
+        "root_controller": scene.rmt_root_controller_name,
+        "torso_controller": scene.rmt_torso_controller_enum,
+        "keep_in_world_origin": scene.keep_in_world_origin,
+        "axes": [scene.axis_x, scene.axis_y, scene.axis_z],
+        "frame_range": [scene.frame_start, scene.frame_end],
+        "output_mode": scene.rmt_output_mode,
+        "output_prefix": scene.rmt_output_prefix,
+        "output_suffix": scene.rmt_output_suffix,
+        "verify_transfer": scene.rmt_verify_transfer,
+        "verify_location_tolerance": scene.rmt_verify_location_tolerance,
+        "verify_rotation_tolerance": scene.rmt_verify_rotation_tolerance,
+    }
+
+def apply_job_settings(scene, settings):
+    """
+    Restores the scene settings a manifest was written with.
+    Returns: False if the rig of the job no longer exists, True otherwise.
+    """
+    rig = bpy.data.objects.get(settings["rig"])
+    if not rig:
+        return False
+    scene.rmt_selected_rig = rig
+
+    scene.controllers.clear()
+    for name in settings["controllers"]:
+        scene.controllers.add().name = name
+    invalidate_controller_index()
+
+    scene.rmt_root_controller_name = settings["root_controller"]
+    if settings["torso_controller"] in settings["controllers"]:
+        scene.rmt_torso_controller_enum = settings["torso_controller"]
+    scene.keep_in_world_origin = settings["keep_in_world_origin"]
+    scene.axis_x, scene.axis_y, scene.axis_z = settings["axes"]
+    scene.frame_start, scene.frame_end = settings["frame_range"]
+    scene.rmt_output_mode = settings["output_mode"]
+    scene.rmt_output_prefix = settings["output_prefix"]
+    scene.rmt_output_suffix = settings["output_suffix"]
+    scene.rmt_verify_transfer = settings["verify_transfer"]
+    scene.rmt_verify_location_tolerance = settings["verify_location_tolerance"]
+    scene.rmt_verify_rotation_tolerance = settings["verify_rotation_tolerance"]
+    return True
+
+def new_entry(name):
+    return {
+        "name": name,
+        "target": name,
+        "status": STATUS_PENDING,
+        "source_fingerprint": None,
+        "result_fingerprint": None,
+        "seconds": None,
+    }
+
+def new_manifest(scene, action_names):
+    now = time.time()
+    return {
+        "version": MANIFEST_VERSION,
+        "blend_file": bpy.data.filepath,
+        "created": now,
+        "updated": now,
+        "checkpoint": None,
+        "settings": job_settings(scene),
+        "actions": [new_entry(name) for name in action_names],
+    }
+
+def write_manifest(path, manifest):
+    """
+    Writes the whole manifest through a temp file so a crash never leaves a truncated manifest behind,
+    then drops the journal it now contains. Only called at the start, on checkpoints and at the end.
+    Raises: OSError if the file cannot be written.
+    """
+    manifest["updated"] = time.time()
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as file:
+        json.dump(manifest, file, separators=(",", ":"))
+    os.replace(tmp_path, path)
+
+    if os.path.isfile(journal_path(path)):
+        os.remove(journal_path(path))
+
+def append_journal(path, entry):
+    """
+    Appends one action entry to the journal, so per-action progress costs a single short write.
+    Raises: OSError if the file cannot be written.
+    """
+    with open(journal_path(path), "a", encoding="utf-8") as file:
+        file.write(json.dumps(entry, separators=(",", ":")) + "\n")
+
+def read_manifest(path):
+    """
+    Reads the manifest and replays the journal written after it.
+    Returns: the manifest stored at path, or None if it is missing or was written by another version.
+    Raises: OSError or ValueError if the file cannot be read or parsed.
+    """
+    if not os.path.isfile(path):
+        return None
+
+    with open(path, encoding="utf-8") as file:
+        manifest = json.load(file)
+
+    if manifest.get("version") != MANIFEST_VERSION:
+        return None
+
+    if os.path.isfile(journal_path(path)):
+        entries = {entry["name"]: entry for entry in manifest["actions"]}
+        with open(journal_path(path), encoding="utf-8") as file:
+            for line in file:
+                try:
+                    update = json.loads(line)
+                except ValueError:
+                    # Last line cut short by a crash
+                    break
+
+                if update["name"] in entries:
+                    entries[update["name"]].update(update)
+                else:
+                    manifest["actions"].append(update)
+                    entries[update["name"]] = update
+
+    return manifest
+
+def unfinished_count(path):
+    """
+    Returns: number of actions not done in the manifest at path, 0 if there is no manifest.
+    Raises: OSError or ValueError if the file cannot be read or parsed.
+    """
+    manifest = read_manifest(path)
+    if manifest is None:
+        return 0
+    return sum(entry["status"] != STATUS_DONE for entry in manifest["actions"])
+
+def discard_manifest(path):
+    """
+    Removes the manifest and its journal.
+    Raises: OSError if a file cannot be removed.
+    """
+    for file_path in (path, journal_path(path), f"{path}.tmp"):
+        if os.path.isfile(file_path):
+            os.remove(file_path)
+
+def settings_changes(scene, settings):
+    """
+    Returns: one line per job setting that differs between the scene and the manifest.
+    """
+    current = job_settings(scene)
+    return [
+        f"{key}: {current.get(key)} -> {value}"
+        for key, value in settings.items()
+        if current.get(key) != value
+    ]
+
+def unfinished_actions(manifest):
+    """
+    Checks every manifest entry against the current file using the fingerprints.
+    Returns: (names to run again, names skipped because their data no longer matches the manifest).
+    """
+    to_run = []
+    mismatched = []
+
+    for entry in manifest["actions"]:
+        status = entry["status"]
+        if status == STATUS_PENDING:
+            to_run.append(entry["name"])
+            continue
+
+        # Finished and the result made it into the saved file
+        target = bpy.data.actions.get(entry["target"])
+        if status == STATUS_DONE and target and action_fingerprint(target) == entry["result_fingerprint"]:
+            continue
+
+        # Source is still pristine, safe to transfer again
+        source = bpy.data.actions.get(entry["name"])
+        if source and action_fingerprint(source) == entry["source_fingerprint"]:
+            to_run.append(entry["name"])
+        else:
+            mismatched.append(entry["name"])
+
+    return to_run, mismatched
@@ -1,4 +1,13 @@
 import bpy
+import re
+import time
+import numpy as np
+from . import manifest as rmt_manifest
+from .properties import get_controller_names, get_controller_index, invalidate_controller_index
+
+# Outcome of the last transfer and batch. Operators that already changed data return FINISHED so an undo
+# step is pushed, and bpy.ops only gives back that status set, so callers read failures from here.
+last_run = {"verified": True, "failed_actions": []}
 
 class RMT_OT_AddController(bpy.types.Operator):
 
@@ -23,13 +32,74 @@ class RMT_OT_AddController(bpy.types.Operator):
             self.report({'WARNING'}, "No bones selected.")
             return {'CANCELLED'}
 
-        for bone in selected_bones:
-            if not any(item.name == bone.name for item in scene.controllers):
-                new_ctrl = scene.controllers.add()
-                new_ctrl.name = bone.name
-                scene.controllers_index = len(scene.controllers) - 1
+        added = add_controllers(scene, [bone.name for bone in selected_bones])
 
-        self.report({'INFO'}, f"Added {len(selected_bones)} controllers.")
+        self.report({'INFO'}, f"Added {added} controllers.")
+        return {'FINISHED'}
+class RMT_OT_AddControllersByPattern(bpy.types.Operator):
+    bl_idname = "rmt.add_controllers_by_pattern"
+    bl_label = "Add Controllers by Pattern"
+    bl_description = "Add every rig bone whose name matches a pattern or that belongs to a bone collection"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    match_by: bpy.props.EnumProperty(
+        name="Match By",
+        items=[
+            ('PATTERN', "Name Pattern", "Match bone names against a regular expression"),
+            ('COLLECTION', "Bone Collection", "Add all bones of a bone collection"),
+        ],
+        default='PATTERN'
+    )
+    pattern: bpy.props.StringProperty(name="Pattern", description="Regular expression searched in bone names")
+    bone_collection: bpy.props.StringProperty(name="Bone Collection")
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self, width=300)
+
+    def draw(self, context):
+        layout = self.layout
+        rig = context.scene.rmt_selected_rig
+
+        layout.prop(self, "match_by", expand=True)
+        if self.match_by == 'PATTERN':
+            layout.prop(self, "pattern")
+        elif rig and rig.type == 'ARMATURE':
+            layout.prop_search(self, "bone_collection", rig.data, "collections_all", text="")
+
+    def execute(self, context):
+        scene = context.scene
+        rig = scene.rmt_selected_rig
+
+        if not rig or rig.type != 'ARMATURE':
+            self.report({'WARNING'}, "Please select a valid rig (Armature).")
+            return {'CANCELLED'}
+
+        if self.match_by == 'PATTERN':
+            # An empty pattern would register every bone of the rig, including deform and mechanism bones
+            if not self.pattern:
+                self.report({'WARNING'}, "Enter a bone name pattern.")
+                return {'CANCELLED'}
+
+            try:
+                regex = re.compile(self.pattern)
+            except re.error as err:
+                self.report({'ERROR'}, f"Invalid pattern '{self.pattern}': {err}")
+                return {'CANCELLED'}
+            bone_names = [pbone.name for pbone in rig.pose.bones if regex.search(pbone.name)]
+        else:
+            bcoll = rig.data.collections_all.get(self.bone_collection)
+            if not bcoll:
+                self.report({'WARNING'}, f"Bone collection '{self.bone_collection}' not found.")
+                return {'CANCELLED'}
+            bone_names = [bone.name for bone in bcoll.bones]
+
+        if not bone_names:
+            self.report({'WARNING'}, "No bones matched.")
+            return {'CANCELLED'}
+
+        added = add_controllers(scene, bone_names)
+
+        self.report({'INFO'}, f"Added {added} controllers.")
         return {'FINISHED'}
 class RMT_OT_ClearControllers(bpy.types.Operator):
     bl_idname = "rmt.clear_controllers"
@@ -39,6 +109,7 @@ class RMT_OT_ClearControllers(bpy.types.Operator):
     def execute(self, context):
         scene = context.scene
         scene.controllers.clear()
+        invalidate_controller_index()
 
         collection = bpy.data.collections.get("RootMotionRefs")
         if collection:
@@ -57,6 +128,8 @@ class RMT_OT_RemoveController(bpy.types.Operator):
     def execute(self, context):
         scene = context.scene
         scene.controllers.remove(self.index)
+        invalidate_controller_index()
+        scene.controllers_index = max(0, min(scene.controllers_index, len(scene.controllers) - 1))
         return {'FINISHED'}
 class RMT_OT_SelectAllControllers(bpy.types.Operator):
     bl_idname = "rmt.select_all_controllers"
@@ -70,7 +143,7 @@ class RMT_OT_SelectAllControllers(bpy.types.Operator):
             self.report({'WARNING'}, "Please select a valid rig (Armature).")
             return {'CANCELLED'}
 
-        controller_names = [ctrl.name for ctrl in scene.controllers]
+        controller_names = get_controller_names(scene)
 
         if not controller_names:
             self.report({'WARNING'}, "No controllers to select.")
@@ -83,9 +156,8 @@ class RMT_OT_SelectAllControllers(bpy.types.Operator):
 
         bpy.ops.pose.select_all(action='DESELECT')
 
-        for name in controller_names:
-            if name in rig.pose.bones:
-                rig.pose.bones[name].bone.select = True
+        for pbone in resolve_controller_bones(rig, controller_names).values():
+            pbone.bone.select = True
 
         self.report({'INFO'}, "Selected all controllers.")
         return {'FINISHED'}
@@ -96,10 +168,13 @@ class RMT_OT_TransferRootMotion(bpy.types.Operator):
     bl_options = {'REGISTER', 'UNDO'}
 
     action_name: bpy.props.StringProperty(name="Action Name", default="")
+    # Set by the batch when output actions were already created in bulk
+    output_prepared: bpy.props.BoolProperty(default=False, options={'HIDDEN', 'SKIP_SAVE'})
 
     def execute(self, context):
         scene = context.scene
         rig = scene.rmt_selected_rig
+        last_run["verified"] = True
 
         if not rig:
             self.report({'WARNING'}, "No rig selected.")
@@ -116,12 +191,18 @@ class RMT_OT_TransferRootMotion(bpy.types.Operator):
             else:
                 self.report({'ERROR'}, f"Action '{self.action_name}' not found.")
                 return {'CANCELLED'}
-            
-        controller_names = [ctrl.name for ctrl in scene.controllers]
+
+        controller_names = get_controller_names(scene)
         if not controller_names:
             self.report({'WARNING'}, "No controllers added.")
             return {'CANCELLED'}
 
+        # Resolve pose bones once and share them between the stages
+        controller_bones = resolve_controller_bones(rig, controller_names)
+        for bone_name in controller_names:
+            if bone_name not in controller_bones:
+                self.report({'WARNING'}, f"Controller '{bone_name}' not found! Skipping.")
+
         root_controller = scene.rmt_root_controller_name
         if not root_controller:
             self.report({'WARNING'}, "No Root Controller selected.")
@@ -129,19 +210,55 @@ class RMT_OT_TransferRootMotion(bpy.types.Operator):
 
         print(f"Using Root Controller: {root_controller}")
 
+        # Write into a copy of the source action instead of overwriting it
+        if scene.rmt_output_mode == 'NEW_ACTION' and not self.output_prepared:
+            action = rig.animation_data.action if rig.animation_data else None
+            if not action:
+                self.report({'WARNING'}, "Rig has no active action.")
+                return {'CANCELLED'}
+
+            if not scene.rmt_output_prefix and not scene.rmt_output_suffix:
+                self.report({'WARNING'}, "Set an output prefix or suffix for new actions.")
+                return {'CANCELLED'}
+
+            source = resolve_source_action(action)
+            if source is None:
+                self.report({'ERROR'}, f"Source action of output '{action.name}' not found.")
+                return {'CANCELLED'}
+
+            output = create_output_actions([source], scene.rmt_output_prefix, scene.rmt_output_suffix)[source.name]
+            keep_action_user(rig, source)
+            rig.animation_data.action = output
+            print(f"[TransferRootMotion] Writing '{source.name}' into new action: {output.name}")
+
         # Call processing functions
         #self.cleanup_reference_objects()
-        self.create_reference(rig, controller_names, scene.axis_x, scene.axis_y, scene.axis_z)
+        self.create_reference(rig, controller_bones, scene.axis_x, scene.axis_y, scene.axis_z)
         self.bake_reference(context)
-        self.constraint_to_reference(rig)
+        self.constraint_to_reference(rig, controller_bones)
         self.transfer_motion(context, rig)
-        self.final_bake(context, rig)
+        self.final_bake(context, rig, controller_bones)
+
+        # Verify against the baked references before they are cleaned up
+        verified = True
+        if scene.rmt_verify_transfer:
+            verified = self.verify_transfer(context, rig, controller_bones)
         self.cleanup_reference_objects()
 
+        # The action is already baked, finish anyway so the change can be undone
+        if not verified:
+            last_run["verified"] = False
+            self.report({'ERROR'}, "Transfer Root Motion exceeded verification tolerance.")
+            return {'FINISHED'}
+
+        # Stamp the baked action, the action picker sorts by it
+        if rig.animation_data and rig.animation_data.action:
+            rig.animation_data.action[LAST_TRANSFERRED_KEY] = time.time()
+
         self.report({'INFO'}, "Transfer Root Motion completed.")
         return {'FINISHED'}
 
-    def create_reference(self, rig, controller_names, axis_x, axis_y, axis_z):
+    def create_reference(self, rig, controller_bones, axis_x, axis_y, axis_z):
         scene = bpy.context.scene
         collection = bpy.data.collections.get("RootMotionRefs")
 
@@ -154,7 +271,7 @@ class RMT_OT_TransferRootMotion(bpy.types.Operator):
             bpy.data.objects.remove(obj, do_unlink=True)
 
         # Create reference object
-        for bone_name in controller_names:
+        for bone_name, pbone in controller_bones.items():
             ref_obj_name = f"{bone_name}-ref"
             if ref_obj_name in bpy.data.objects.keys():
                 self.report({'WARNING'}, f"Reference object '{ref_obj_name}' already exists! Skipping.")
@@ -164,7 +281,7 @@ class RMT_OT_TransferRootMotion(bpy.types.Operator):
             collection.objects.link(empty_ref)
 
             empty_ref.parent = rig
-            empty_ref.matrix_world = rig.matrix_world @ rig.pose.bones[bone_name].matrix
+            empty_ref.matrix_world = rig.matrix_world @ pbone.matrix
             empty_ref.empty_display_size = scene.empty_size if hasattr(scene, "empty_size") else 0.2
             empty_ref.empty_display_type = 'SPHERE'
 
@@ -220,10 +337,7 @@ class RMT_OT_TransferRootMotion(bpy.types.Operator):
 
         self.report({'INFO'}, f"Bake completed. Renamed {renamed_count} actions with '_refAction' suffix.")
 
-    def constraint_to_reference(self, rig):
-        scene = bpy.context.scene
-        controller_names = [ctrl.name for ctrl in scene.controllers]
-
+    def constraint_to_reference(self, rig, controller_bones):
         collection = bpy.data.collections.get("RootMotionRefs")
         if not collection:
             self.report({'ERROR'}, "No reference objects found!")
@@ -236,7 +350,7 @@ class RMT_OT_TransferRootMotion(bpy.types.Operator):
         if rig.mode != 'POSE':
             bpy.ops.object.mode_set(mode='POSE')
 
-        for bone_name in controller_names:
+        for bone_name, pbone in controller_bones.items():
             ref_obj_name = f"{bone_name}-ref"
             ref_obj = ref_objs.get(ref_obj_name)
 
@@ -244,11 +358,6 @@ class RMT_OT_TransferRootMotion(bpy.types.Operator):
                 self.report({'WARNING'}, f"Reference object '{ref_obj_name}' not found! Skipping.")
                 continue
 
-            pbone = rig.pose.bones.get(bone_name)
-            if not pbone:
-                self.report({'WARNING'}, f"Pose bone '{bone_name}' not found! Skipping.")
-                continue
-
             # Clear old constraints
             for con in pbone.constraints:
                 if con.name.startswith("RMT_Constraint"):
@@ -383,13 +492,12 @@ class RMT_OT_TransferRootMotion(bpy.types.Operator):
         else:
             self.report({'INFO'}, "No extra reference actions found to remove.")
 
-    def final_bake(self, context, rig):
+    def final_bake(self, context, rig, controller_bones):
         scene = context.scene
         frame_start = scene.frame_start
         frame_end = scene.frame_end
 
         root_controller_name = scene.rmt_root_controller_name
-        controller_names = [ctrl.name for ctrl in scene.controllers]
 
         if not root_controller_name:
             self.report({'ERROR'}, "No Root Controller selected for baking!")
@@ -424,18 +532,13 @@ class RMT_OT_TransferRootMotion(bpy.types.Operator):
         # Bake Other Controllers
         bpy.ops.pose.select_all(action='DESELECT')
 
-        other_controllers = [name for name in controller_names if name != root_controller_name]
+        other_controllers = [name for name in controller_bones if name != root_controller_name]
 
         for bone_name in other_controllers:
-            pbone = rig.pose.bones.get(bone_name)
-            if not pbone:
-                self.report({'WARNING'}, f"Controller '{bone_name}' not found! Skipping.")
-                continue
-
-            pbone.bone.select = True
+            controller_bones[bone_name].bone.select = True
 
         if other_controllers:
-            rig.data.bones.active = rig.data.bones[other_controllers[0]]
+            rig.data.bones.active = controller_bones[other_controllers[0]].bone
 
             bpy.ops.nla.bake(
                 frame_start=frame_start,
@@ -452,6 +555,375 @@ class RMT_OT_TransferRootMotion(bpy.types.Operator):
             self.report({'WARNING'}, "No other controllers to bake.")
 
         return {'FINISHED'}  
+
+    def verify_transfer(self, context, rig, controller_bones):
+        """
+        Compares the world-space motion of the transferred controllers against the reference empties
+        baked from the source action. The root controller is skipped, its motion is meant to change.
+        Returns: True if every controller stays within the scene tolerances, False otherwise.
+        """
+        scene = context.scene
+        root_controller_name = scene.rmt_root_controller_name
+
+        collection = bpy.data.collections.get("RootMotionRefs")
+        if not collection:
+            self.report({'WARNING'}, "No reference objects found! Skipping verification.")
+            return True
+
+        pairs = []
+        for bone_name, pbone in controller_bones.items():
+            if bone_name == root_controller_name:
+                continue
+
+            ref_obj = collection.objects.get(f"{bone_name}-ref")
+            if ref_obj:
+                pairs.append((bone_name, ref_obj, pbone))
+
+        if not pairs:
+            self.report({'WARNING'}, "No controllers to verify.")
+            return True
+
+        action = rig.animation_data.action if rig.animation_data else None
+        action_name = action.name if action else "<none>"
+
+        # Both sides were just baked, so read their keyframes instead of evaluating the scene again
+        matrices = None
+        if action and fcurves_evaluable(rig, [pbone.bone for _, _, pbone in pairs], [ref_obj for _, ref_obj, _ in pairs]):
+            frames = np.arange(scene.frame_start, scene.frame_end + 1, dtype=float)
+            matrices = fcurve_world_matrices(rig, action, pairs, frames)
+
+        if matrices is not None:
+            source, result = matrices
+        else:
+            print("[Verify] Controllers depend on constraints, drivers, NLA or non-baked parents, sampling the scene instead.")
+            frames = range(scene.frame_start, scene.frame_end + 1)
+            source, result = sample_world_transforms(scene, rig, pairs, frames)
+        loc_error, rot_error = transform_errors(source, result)
+
+        loc_max = loc_error.max(axis=1)
+        loc_rms = np.sqrt(np.mean(loc_error ** 2, axis=1))
+        rot_max = rot_error.max(axis=1)
+        rot_rms = np.sqrt(np.mean(rot_error ** 2, axis=1))
+
+        print(f"[Verify] Action: {action_name}")
+        for index, (bone_name, _, _) in enumerate(pairs):
+            print(f"[Verify]   {bone_name}: location max {loc_max[index]:.6f} rms {loc_rms[index]:.6f}, "
+                  f"rotation max {np.degrees(rot_max[index]):.4f} deg rms {np.degrees(rot_rms[index]):.4f} deg")
+
+        failed = [
+            bone_name for index, (bone_name, _, _) in enumerate(pairs)
+            if loc_max[index] > scene.rmt_verify_location_tolerance
+            or rot_max[index] > scene.rmt_verify_rotation_tolerance
+        ]
+
+        summary = (f"Verified '{action_name}': location max {loc_max.max():.6f} rms {np.sqrt(np.mean(loc_error ** 2)):.6f}, "
+                   f"rotation max {np.degrees(rot_max.max()):.4f} deg rms {np.degrees(np.sqrt(np.mean(rot_error ** 2))):.4f} deg")
+        if failed:
+            self.report({'ERROR'}, f"{summary}. Out of tolerance: {', '.join(failed)}")
+            return False
+
+        self.report({'INFO'}, summary)
+        return True
+
+# --- Helper functions for the controller list ---
+def add_controllers(scene, bone_names):
+    """
+    Appends the given bone names to scene.controllers, skipping names that are already registered.
+    Returns: number of controllers added.
+    """
+    existing = set(get_controller_index(scene))
+    added = 0
+
+    for bone_name in bone_names:
+        if bone_name in existing:
+            continue
+
+        new_ctrl = scene.controllers.add()
+        new_ctrl.name = bone_name
+        existing.add(bone_name)
+        added += 1
+
+    if added:
+        scene.controllers_index = len(scene.controllers) - 1
+        invalidate_controller_index()
+
+    return added
+
+def resolve_controller_bones(rig, controller_names):
+    """
+    Returns: dict mapping controller name to its pose bone, in controller order. Missing bones are left out.
+    """
+    pose_bones = rig.pose.bones
+    controller_bones = {}
+    for bone_name in controller_names:
+        pbone = pose_bones.get(bone_name)
+        if pbone:
+            controller_bones[bone_name] = pbone
+    return controller_bones
+
+# --- Helper functions for non-destructive output ---
+OUTPUT_SOURCE_KEY = "rmt_source_action"
+LAST_TRANSFERRED_KEY = "rmt_last_transferred"
+
+def resolve_source_action(action):
+    """
+    Returns: the pristine source action if the given action is a transfer output, otherwise the action itself.
+    None if the action is an output whose source was deleted, it must never be transferred again itself.
+    """
+    if OUTPUT_SOURCE_KEY in action:
+        return action[OUTPUT_SOURCE_KEY]
+    return action
+
+def keep_action_user(rig, action):
+    """
+    Gives the action a fake user if the rig is its only user, so assigning another action to the rig
+    does not leave it orphaned and purged on the next save.
+    """
+    if rig.animation_data and rig.animation_data.action == action and action.users == 1 and not action.use_fake_user:
+        action.use_fake_user = True
+
+def create_output_actions(sources, prefix, suffix):
+    """
+    Copies each source action into a new output action named prefix + name + suffix, linked back to
+    its source through an ID custom property, which follows renames. Outputs of the same source from a previous run are replaced,
+    any other action already using the name is kept and the output gets a unique name instead.
+    Returns: dict mapping source action name to its output action.
+    """
+    outputs = {}
+    for source in sources:
+        output_name = f"{prefix}{source.name}{suffix}"
+
+        old_output = bpy.data.actions.get(output_name)
+        if old_output and old_output.get(OUTPUT_SOURCE_KEY) == source:
+            bpy.data.actions.remove(old_output, do_unlink=True)
+        elif old_output:
+            print(f"[Output] Action '{output_name}' is not an output of '{source.name}', keeping it.")
+
+        output = source.copy()
+        # Blender appends a numeric suffix if the name is still taken
+        output.name = output_name
+        output.use_fake_user = True
+        output[OUTPUT_SOURCE_KEY] = source
+        outputs[source.name] = output
+
+    return outputs
+
+# --- Helper functions, only call in RMT_OT_TransferRootMotion.verify_transfer ---
+def fcurves_evaluable(rig, bones, ref_objs):
+    """
+    Checks if the world motion of the given bones and reference objects follows from their keyframes alone,
+    i.e. no constraints, drivers, active NLA tracks or non-default inheritance anywhere in the bone chains.
+    Returns: True if fcurve_world_matrices gives the same result as evaluating the scene, False otherwise.
+    """
+    if any(not track.mute for track in rig.animation_data.nla_tracks):
+        return False
+
+    for ref_obj in ref_objs:
+        if ref_obj.constraints or not (ref_obj.animation_data and ref_obj.animation_data.action):
+            return False
+
+    driven = {fcurve.data_path for fcurve in rig.animation_data.drivers}
+    checked = set()
+    for bone in bones:
+        while bone and bone.name not in checked:
+            checked.add(bone.name)
+            pbone = rig.pose.bones[bone.name]
+            prefix = f'pose.bones["{bpy.utils.escape_identifier(bone.name)}"]'
+
+            if pbone.constraints or any(path.startswith(prefix) for path in driven):
+                return False
+            if bone.inherit_scale != 'FULL' or not bone.use_inherit_rotation or not bone.use_local_location:
+                return False
+
+            bone = bone.parent
+
+    return True
+
+def fcurve_world_matrices(rig, action, pairs, frames):
+    """
+    Builds world matrices of each (name, reference object, pose bone) pair from the baked keyframes,
+    composing bone chains in numpy. Only valid when fcurves_evaluable returned True.
+    Returns: two arrays (reference, bone) of shape (controllers, frames, 4, 4), or None if a curve involved
+    is not keyed on every frame (e.g. a non-controller parent with its original sparse keys).
+    """
+    rig_matrix = np.array(rig.matrix_world)
+    rig_fcurves = fcurve_map(action)
+    pose_cache = {}
+
+    source = np.empty((len(pairs), len(frames), 4, 4))
+    result = np.empty_like(source)
+
+    for c, (_, ref_obj, pbone) in enumerate(pairs):
+        # Reference empties are parented to the rig without parent inverse, so their keys are in rig space
+        ref_basis = owner_basis_matrices(fcurve_map(ref_obj.animation_data.action), "", ref_obj, frames)
+        pose = bone_pose_matrices(rig, rig_fcurves, pbone.bone, frames, pose_cache)
+        if ref_basis is None or pose is None:
+            return None
+
+        source[c] = rig_matrix @ ref_basis
+        result[c] = rig_matrix @ pose
+
+    return source, result
+
+def fcurve_map(action):
+    return {(fcurve.data_path, fcurve.array_index): fcurve for fcurve in action.fcurves}
+
+def channel_samples(fcurves, data_path, defaults, frames):
+    """
+    Reads an animated vector property at the given frames from its keyframe values. Unkeyed channels keep
+    their current value. Curves must be baked, i.e. have one key on every frame and no modifiers, since
+    interpolation between sparse Bezier keys is not reproduced here.
+    Returns: array of shape (frames, len(defaults)), or None if a curve is not baked.
+    """
+    values = np.tile(np.array(defaults, dtype=float), (len(frames), 1))
+
+    for index in range(len(defaults)):
+        fcurve = fcurves.get((data_path, index))
+        if not fcurve or not fcurve.keyframe_points:
+            continue
+        if fcurve.mute or fcurve.modifiers:
+            return None
+
+        co = np.empty(len(fcurve.keyframe_points) * 2, dtype=np.float32)
+        fcurve.keyframe_points.foreach_get("co", co)
+        co = co.reshape(-1, 2)
+
+        in_range = (co[:, 0] > frames[0] - 0.5) & (co[:, 0] < frames[-1] + 0.5)
+        keys = co[in_range]
+        if len(keys) != len(frames) or not np.allclose(keys[:, 0], frames):
+            return None
+        values[:, index] = keys[:, 1]
+
+    return values
+
+def owner_basis_matrices(fcurves, prefix, owner, frames):
+    """
+    Returns: local transform matrices of shape (frames, 4, 4) of an object or pose bone from its location,
+    rotation and scale channels. prefix is the data path of the owner inside the action ('' for objects).
+    Returns None if one of the channels is not baked.
+    """
+    mode = owner.rotation_mode
+    if mode == 'QUATERNION':
+        rot = channel_samples(fcurves, f"{prefix}rotation_quaternion", owner.rotation_quaternion, frames)
+    elif mode == 'AXIS_ANGLE':
+        rot = channel_samples(fcurves, f"{prefix}rotation_axis_angle", owner.rotation_axis_angle, frames)
+    else:
+        rot = channel_samples(fcurves, f"{prefix}rotation_euler", owner.rotation_euler, frames)
+
+    loc = channel_samples(fcurves, f"{prefix}location", owner.location, frames)
+    scale = channel_samples(fcurves, f"{prefix}scale", owner.scale, frames)
+    if rot is None or loc is None or scale is None:
+        return None
+
+    matrices = np.zeros((len(frames), 4, 4))
+    matrices[:, :3, :3] = rotation_matrices(rot, mode) * scale[:, None, :]
+    matrices[:, :3, 3] = loc
+    matrices[:, 3, 3] = 1.0
+    return matrices
+
+def rotation_matrices(rot, mode):
+    """
+    Returns: rotation matrices of shape (frames, 3, 3) for quaternion (wxyz), axis angle (angle xyz) or euler values.
+    """
+    if mode == 'AXIS_ANGLE':
+        axis = rot[:, 1:] / np.maximum(np.linalg.norm(rot[:, 1:], axis=1, keepdims=True), 1e-12)
+        half = rot[:, :1] * 0.5
+        rot = np.hstack((np.cos(half), axis * np.sin(half)))
+        mode = 'QUATERNION'
+
+    if mode == 'QUATERNION':
+        w, x, y, z = (rot / np.maximum(np.linalg.norm(rot, axis=1, keepdims=True), 1e-12)).T
+        return np.stack((
+            np.stack((1 - 2 * (y * y + z * z), 2 * (x * y - w * z), 2 * (x * z + w * y)), axis=-1),
+            np.stack((2 * (x * y + w * z), 1 - 2 * (x * x + z * z), 2 * (y * z - w * x)), axis=-1),
+            np.stack((2 * (x * z - w * y), 2 * (y * z + w * x), 1 - 2 * (x * x + y * y)), axis=-1),
+        ), axis=1)
+
+    # Euler 'XYZ' applies X first, so the matrix is Rz @ Ry @ Rx
+    cos, sin = np.cos(rot), np.sin(rot)
+    ones, zeros = np.ones(len(rot)), np.zeros(len(rot))
+    axes = {
+        'X': np.stack((np.stack((ones, zeros, zeros), -1),
+                       np.stack((zeros, cos[:, 0], -sin[:, 0]), -1),
+                       np.stack((zeros, sin[:, 0], cos[:, 0]), -1)), axis=1),
+        'Y': np.stack((np.stack((cos[:, 1], zeros, sin[:, 1]), -1),
+                       np.stack((zeros, ones, zeros), -1),
+                       np.stack((-sin[:, 1], zeros, cos[:, 1]), -1)), axis=1),
+        'Z': np.stack((np.stack((cos[:, 2], -sin[:, 2], zeros), -1),
+                       np.stack((sin[:, 2], cos[:, 2], zeros), -1),
+                       np.stack((zeros, zeros, ones), -1)), axis=1),
+    }
+    return axes[mode[2]] @ axes[mode[1]] @ axes[mode[0]]
+
+def bone_pose_matrices(rig, fcurves, bone, frames, cache):
+    """
+    Returns: armature-space pose matrices of shape (frames, 4, 4) of a bone, composed through its parents,
+    or None if a curve in the chain is not baked. Results are cached by bone name so shared parents are only built once.
+    """
+    if bone.name in cache:
+        return cache[bone.name]
+
+    pbone = rig.pose.bones[bone.name]
+    prefix = f'pose.bones["{bpy.utils.escape_identifier(bone.name)}"].'
+    basis = owner_basis_matrices(fcurves, prefix, pbone, frames)
+    if basis is None:
+        cache[bone.name] = None
+        return None
+
+    # Location has no effect on connected bones
+    if bone.use_connect:
+        basis[:, :3, 3] = 0.0
+
+    rest = np.array(bone.matrix_local)
+    if bone.parent:
+        parent = bone_pose_matrices(rig, fcurves, bone.parent, frames, cache)
+        if parent is None:
+            cache[bone.name] = None
+            return None
+        offset = np.linalg.inv(np.array(bone.parent.matrix_local)) @ rest
+        pose = parent @ offset @ basis
+    else:
+        pose = rest @ basis
+
+    cache[bone.name] = pose
+    return pose
+
+def sample_world_transforms(scene, rig, pairs, frames):
+    """
+    Fallback for rigs whose motion does not follow from keyframes alone: evaluates the scene on every frame
+    and samples the world matrices of each (name, reference object, pose bone) pair.
+    Returns: two arrays (reference, bone) of shape (controllers, frames, 4, 4).
+    """
+    frame_current = scene.frame_current
+
+    source = np.empty((len(pairs), len(frames), 4, 4))
+    result = np.empty_like(source)
+
+    for f, frame in enumerate(frames):
+        scene.frame_set(frame)
+        rig_matrix = rig.matrix_world
+
+        for c, (_, ref_obj, pbone) in enumerate(pairs):
+            source[c, f] = ref_obj.matrix_world
+            result[c, f] = rig_matrix @ pbone.matrix
+
+    scene.frame_set(frame_current)
+    return source, result
+
+def transform_errors(source, result):
+    """
+    Returns: per controller and frame location distance and rotation angle (radians) between two matrix arrays.
+    """
+    loc_error = np.linalg.norm(result[..., :3, 3] - source[..., :3, 3], axis=-1)
+
+    # Remove scale from the columns, then the angle follows from the trace of R1^T @ R2
+    rot_source = source[..., :3, :3] / np.linalg.norm(source[..., :3, :3], axis=-2, keepdims=True)
+    rot_result = result[..., :3, :3] / np.linalg.norm(result[..., :3, :3], axis=-2, keepdims=True)
+    trace = np.sum(rot_source * rot_result, axis=(-2, -1))
+    rot_error = np.arccos(np.clip((trace - 1.0) * 0.5, -1.0, 1.0))
+
+    return loc_error, rot_error
+
 # class RMT_OT_BatchTransferRootMotion(bpy.types.Operator):  Old, no need anymore
 #     bl_idname = "rmt.batch_transfer_root_motion"
 #     bl_label = "Batch Transfer Root Motion"  
@@ -465,43 +937,280 @@ class RMT_OT_BatchTransferRootMotionContinue(bpy.types.Operator):
     bl_idname = "rmt.batch_transfer_root_motion_continue"
     bl_label = "Batch Transfer Root Motion"
     bl_description = "Apply Transfer Root Motion for all selected Actions"
+    # Kept for OVERWRITE mode. Called from the action picker, whose own UNDO flag owns the undo step anyway
     bl_options = {'REGISTER', 'UNDO'}
 
+    # Set by RMT_OT_ResumeBatchTransfer to keep updating the existing manifest
+    resume: bpy.props.BoolProperty(default=False, options={'HIDDEN', 'SKIP_SAVE'})
+
     def execute(self, context):
         scene = context.scene
         selected_actions = scene.rmt_batch_actions
+        last_run["failed_actions"] = []
 
         if not selected_actions:
             self.report({'WARNING'}, "No actions selected for batch processing.")
             return {'CANCELLED'}
 
-        # Save current action to restore
         rig = scene.rmt_selected_rig
+        if not rig:
+            self.report({'WARNING'}, "No rig selected.")
+            return {'CANCELLED'}
+
+        # Manifest of the job, written as we go so a crashed batch can be resumed
+        manifest_path = rmt_manifest.manifest_path()
+        try:
+            # Never overwrite an unfinished job, it is what a resume would need
+            if not self.resume:
+                unfinished = rmt_manifest.unfinished_count(manifest_path)
+                if unfinished:
+                    self.report({'ERROR'}, f"Batch manifest has {unfinished} unfinished actions, resume or discard it first.")
+                    return {'CANCELLED'}
+
+            manifest = rmt_manifest.read_manifest(manifest_path) if self.resume else None
+            if manifest is None:
+                manifest = rmt_manifest.new_manifest(scene, [item.name for item in selected_actions])
+            rmt_manifest.write_manifest(manifest_path, manifest)
+        except (OSError, ValueError) as err:
+            self.report({'ERROR'}, f"Could not access batch manifest '{manifest_path}': {err}")
+            return {'CANCELLED'}
+        manifest_ok = True
+        entries = {entry["name"]: entry for entry in manifest["actions"]}
+
+        checkpoint_interval = scene.rmt_checkpoint_interval if bpy.data.filepath else 0
+        if scene.rmt_checkpoint_interval and not bpy.data.filepath:
+            self.report({'WARNING'}, "File is not saved, checkpoints are disabled.")
+
+        # Save current action to restore (by name, outputs from a previous run may be replaced)
         current_action = rig.animation_data.action if rig.animation_data else None
+        current_action_name = current_action.name if current_action else ""
+        # Checkpoints save while other actions are assigned, it must not be dropped as an orphan
+        if current_action:
+            keep_action_user(rig, current_action)
+
+        action_names = [item.name for item in selected_actions]
+        source_names = action_names
+        unresolved = []
+        output_prepared = scene.rmt_output_mode == 'NEW_ACTION'
 
-        for item in selected_actions:
-            action_name = item.name
+        # Create every output action up front through the data API, sources stay untouched
+        if output_prepared:
+            if not scene.rmt_output_prefix and not scene.rmt_output_suffix:
+                self.report({'WARNING'}, "Set an output prefix or suffix for new actions.")
+                return {'CANCELLED'}
+
+            # Resolve sources before old outputs get replaced
+            source_names = []
+            sources = {}
+            for name in action_names:
+                action = bpy.data.actions.get(name)
+                source = resolve_source_action(action) if action else None
+                if action and source is None:
+                    self.report({'ERROR'}, f"Source action of output '{name}' not found, skipping.")
+                    unresolved.append(name)
+                    continue
+
+                source_names.append(source.name if source else name)
+                if source:
+                    sources[source.name] = source
+
+            outputs = create_output_actions(sources.values(), scene.rmt_output_prefix, scene.rmt_output_suffix)
+            action_names = [outputs[name].name if name in outputs else name for name in source_names]
+            print(f"[Batch] Created {len(outputs)} output actions.")
+
+        failed_actions = list(unresolved)
+        processed = 0
+        for source_name, action_name in zip(source_names, action_names):
             print(f"\n[Batch] Processing Action: {action_name}")
-            result = bpy.ops.rmt.transfer_root_motion('INVOKE_DEFAULT', action_name=action_name)
-            if result != {'FINISHED'}:
+
+            entry = entries.get(source_name)
+            if entry is None:
+                entry = rmt_manifest.new_entry(source_name)
+                manifest["actions"].append(entry)
+                entries[source_name] = entry
+
+            # Record the pristine source before it is touched
+            source = bpy.data.actions.get(source_name)
+            entry["target"] = action_name
+            entry["status"] = rmt_manifest.STATUS_RUNNING
+            entry["source_fingerprint"] = rmt_manifest.action_fingerprint(source) if source else None
+            entry["result_fingerprint"] = None
+            if manifest_ok:
+                manifest_ok = self.update_manifest(rmt_manifest.append_journal, manifest_path, entry)
+
+            start_time = time.perf_counter()
+            result = bpy.ops.rmt.transfer_root_motion('INVOKE_DEFAULT', action_name=action_name, output_prepared=output_prepared)
+            entry["seconds"] = round(time.perf_counter() - start_time, 3)
+
+            target = bpy.data.actions.get(action_name)
+            entry["result_fingerprint"] = rmt_manifest.action_fingerprint(target) if target else None
+            if result != {'FINISHED'} or not last_run["verified"]:
                 self.report({'ERROR'}, f"Failed to process action: {action_name}")
+                failed_actions.append(action_name)
+                entry["status"] = rmt_manifest.STATUS_FAILED
+            else:
+                entry["status"] = rmt_manifest.STATUS_DONE
+            if manifest_ok:
+                manifest_ok = self.update_manifest(rmt_manifest.append_journal, manifest_path, entry)
+
+            # Same settings would fail the remaining sources too, do not overwrite them
+            if not last_run["verified"] and not output_prepared:
+                self.report({'ERROR'}, f"Stopped batch after verification failure, {len(action_names) - processed - 1} actions left untouched.")
+                break
+
+            # Save the file periodically, the manifest only tells which results made it to disk
+            processed += 1
+            if checkpoint_interval and processed % checkpoint_interval == 0:
+                try:
+                    bpy.ops.wm.save_mainfile()
+                except RuntimeError as err:
+                    self.report({'WARNING'}, f"Checkpoint save failed: {err}")
+                else:
+                    manifest["checkpoint"] = time.time()
+                    print(f"[Batch] Checkpoint saved after {processed} actions.")
+                if manifest_ok:
+                    manifest_ok = self.update_manifest(rmt_manifest.write_manifest, manifest_path, manifest)
 
         # Returns the original action (if any)
+        current_action = bpy.data.actions.get(current_action_name) if current_action_name else None
         if current_action:
             rig.animation_data.action = current_action
             print("[Batch] Restored original action.")
 
+        if manifest_ok and self.update_manifest(rmt_manifest.write_manifest, manifest_path, manifest):
+            print(f"[Batch] Manifest written to: {manifest_path}")
+
+        # Actions were already modified, finish anyway so the batch can be undone
+        last_run["failed_actions"] = failed_actions
+        if failed_actions:
+            self.report({'ERROR'}, f"Batch Transfer Root Motion failed for {len(failed_actions)} actions: {', '.join(failed_actions)}")
+            return {'FINISHED'}
+
         self.report({'INFO'}, "Batch Transfer Root Motion completed.")
         return {'FINISHED'}
 
+    def update_manifest(self, write, manifest_path, data):
+        """
+        Calls a manifest write function, reporting instead of aborting the batch halfway on failure.
+        Returns: False if writing failed and the manifest should not be updated anymore.
+        """
+        try:
+            write(manifest_path, data)
+        except OSError as err:
+            self.report({'WARNING'}, f"Could not update batch manifest, continuing without it: {err}")
+            return False
+        return True
+
+class RMT_OT_ResumeBatchTransfer(bpy.types.Operator):
+    bl_idname = "rmt.resume_batch_transfer"
+    bl_label = "Resume Batch Transfer"
+    bl_description = "Reload the batch manifest saved next to this file and continue with the unfinished actions"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    # Job summary shown in the confirmation dialog, one line per entry
+    summary: bpy.props.StringProperty(options={'HIDDEN', 'SKIP_SAVE'})
+
+    def invoke(self, context, event):
+        manifest = self.load_manifest()
+        if manifest is None:
+            return {'CANCELLED'}
+
+        settings = manifest["settings"]
+        remaining = sum(entry["status"] != rmt_manifest.STATUS_DONE for entry in manifest["actions"])
+        lines = [
+            f"Rig: {settings['rig']}, {len(settings['controllers'])} controllers",
+            f"Actions not done: {remaining} of {len(manifest['actions'])}",
+        ]
+        changes = rmt_manifest.settings_changes(context.scene, settings)
+        if changes:
+            lines.append("Scene settings that will be replaced:")
+            lines.extend(f"  {change}" for change in changes)
+        self.summary = "\n".join(lines)
+
+        return context.window_manager.invoke_props_dialog(self, width=450)
+
+    def draw(self, context):
+        layout = self.layout
+        layout.label(text="Resume batch job from manifest?", icon='RECOVER_LAST')
+
+        col = layout.column(align=True)
+        for line in self.summary.split("\n"):
+            col.label(text=line)
+
+    def load_manifest(self):
+        manifest_path = rmt_manifest.manifest_path()
+        try:
+            manifest = rmt_manifest.read_manifest(manifest_path)
+        except (OSError, ValueError) as err:
+            self.report({'ERROR'}, f"Could not read batch manifest '{manifest_path}': {err}")
+            return None
+
+        if manifest is None:
+            self.report({'WARNING'}, f"No batch manifest found at: {manifest_path}")
+        return manifest
+
+    def execute(self, context):
+        scene = context.scene
+        manifest = self.load_manifest()
+
+        if manifest is None:
+            return {'CANCELLED'}
+
+        if not rmt_manifest.apply_job_settings(scene, manifest["settings"]):
+            self.report({'ERROR'}, f"Rig '{manifest['settings']['rig']}' of the batch job not found.")
+            return {'CANCELLED'}
+
+        to_run, mismatched = rmt_manifest.unfinished_actions(manifest)
+        if mismatched:
+            # Neither pristine nor the recorded result, re-running could transfer twice
+            self.report({'WARNING'}, f"Skipped {len(mismatched)} actions changed since the manifest was written: {', '.join(mismatched)}")
+
+        if not to_run:
+            self.report({'INFO'}, "Batch job already completed.")
+            return {'FINISHED'}
+
+        scene.rmt_batch_actions.clear()
+        for name in to_run:
+            item = scene.rmt_batch_actions.add()
+            item.name = name
+            item.action = bpy.data.actions.get(name)
+
+        print(f"[Batch] Resuming {len(to_run)} of {len(manifest['actions'])} actions.")
+        bpy.ops.rmt.batch_transfer_root_motion_continue(resume=True)
+
+        # Scene settings were replaced, finish whatever the batch result so it can be undone
+        return {'FINISHED'}
+
+class RMT_OT_DiscardBatchManifest(bpy.types.Operator):
+    bl_idname = "rmt.discard_batch_manifest"
+    bl_label = "Discard Batch Manifest"
+    bl_description = "Delete the batch manifest saved next to this file, the unfinished job can no longer be resumed"
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_confirm(self, event)
+
+    def execute(self, context):
+        manifest_path = rmt_manifest.manifest_path()
+        try:
+            rmt_manifest.discard_manifest(manifest_path)
+        except OSError as err:
+            self.report({'ERROR'}, f"Could not delete batch manifest '{manifest_path}': {err}")
+            return {'CANCELLED'}
+
+        self.report({'INFO'}, "Discarded batch manifest.")
+        return {'FINISHED'}
+
 classes = [
     RMT_OT_AddController,
+    RMT_OT_AddControllersByPattern,
     RMT_OT_ClearControllers,
     RMT_OT_RemoveController,
     RMT_OT_SelectAllControllers,
     RMT_OT_TransferRootMotion,
     # RMT_OT_BatchTransferRootMotion,
     RMT_OT_BatchTransferRootMotionContinue,
+    RMT_OT_ResumeBatchTransfer,
+    RMT_OT_DiscardBatchManifest,
 ]
 
 def register():
@@ -1,17 +1,66 @@
 import bpy
+import math
+from bpy.app.handlers import persistent
 
 class RMT_ControllerItem(bpy.types.PropertyGroup):
     name: bpy.props.StringProperty()
 class RMT_ActionItem(bpy.types.PropertyGroup):
+    name: bpy.props.StringProperty(name="Action Name")
     action: bpy.props.PointerProperty(type=bpy.types.Action)
     is_selected: bpy.props.BoolProperty(name="Select", default=False)
+    frame_length: bpy.props.FloatProperty(name="Frame Length")
+    last_transferred: bpy.props.FloatProperty(name="Last Transferred", description="Unix time of the last transfer, 0 if never")
+
+# Cached lookups for scene.controllers, keyed by scene pointer. Rebuilt lazily after add/remove/clear,
+# undo/redo and file load. Only names and indices are cached, RNA pointers do not survive undo.
+_controller_cache = {}
+
+def invalidate_controller_index():
+    _controller_cache.clear()
+
+def _controller_entry(scene):
+    key = scene.as_pointer()
+    entry = _controller_cache.get(key)
+
+    if entry is None or entry["count"] != len(scene.controllers):
+        names = tuple(ctrl.name for ctrl in scene.controllers)
+        entry = {
+            "count": len(names),
+            "names": names,
+            "index": {name: index for index, name in enumerate(names)},
+            # Enum items must stay referenced from Python, otherwise Blender may show garbage strings
+            "enum_items": [(name, name, "") for name in names],
+        }
+        _controller_cache[key] = entry
+
+    return entry
+
+def get_controller_names(scene):
+    return _controller_entry(scene)["names"]
+
+def get_controller_index(scene):
+    """
+    Returns: dict mapping controller name to its index in scene.controllers.
+    """
+    return _controller_entry(scene)["index"]
 
 def get_torso_items(self, context):
-    scene = context.scene
-    return [(ctrl.name, ctrl.name, "") for ctrl in scene.controllers]
+    return _controller_entry(context.scene)["enum_items"]
+
+@persistent
+def _invalidate_controller_index_handler(*args):
+    invalidate_controller_index()
+
+_controller_index_handlers = (
+    bpy.app.handlers.load_post,
+    bpy.app.handlers.undo_post,
+    bpy.app.handlers.redo_post,
+)
 
 def register():
     bpy.utils.register_class(RMT_ControllerItem)
+    for handlers in _controller_index_handlers:
+        handlers.append(_invalidate_controller_index_handler)
     # bpy.types.Scene.rmt_selected_actions = bpy.props.CollectionProperty(type=bpy.types.Action)
     bpy.types.Scene.rmt_selected_rig = bpy.props.PointerProperty(
         name="Rig", type=bpy.types.Object,
@@ -36,8 +85,57 @@ def register():
         description="Keep root controller at world origin",
         default=False
     )
+    bpy.types.Scene.rmt_output_mode = bpy.props.EnumProperty(
+        name="Output",
+        description="Where the transferred motion is written",
+        items=[
+            ('OVERWRITE', "Overwrite Source", "Bake the transferred motion into the source action"),
+            ('NEW_ACTION', "New Action", "Bake the transferred motion into a new action and leave the source untouched"),
+        ],
+        default='OVERWRITE'
+    )
+    bpy.types.Scene.rmt_output_prefix = bpy.props.StringProperty(
+        name="Prefix",
+        description="Prefix added to the source action name for new actions",
+        default=""
+    )
+    bpy.types.Scene.rmt_output_suffix = bpy.props.StringProperty(
+        name="Suffix",
+        description="Suffix added to the source action name for new actions",
+        default="_RM"
+    )
+    bpy.types.Scene.rmt_verify_transfer = bpy.props.BoolProperty(
+        name="Verify Transfer",
+        description="Compare controller world motion against the source action after baking and fail if it exceeds tolerance",
+        default=False
+    )
+    bpy.types.Scene.rmt_verify_location_tolerance = bpy.props.FloatProperty(
+        name="Location Tolerance",
+        description="Maximum allowed world-space location error per controller",
+        default=0.001, min=0.0, precision=4,
+        subtype='DISTANCE', unit='LENGTH'
+    )
+    bpy.types.Scene.rmt_verify_rotation_tolerance = bpy.props.FloatProperty(
+        name="Rotation Tolerance",
+        description="Maximum allowed world-space rotation error per controller",
+        default=math.radians(0.1), min=0.0, precision=3,
+        subtype='ANGLE'
+    )
+    bpy.types.Scene.rmt_checkpoint_interval = bpy.props.IntProperty(
+        name="Checkpoint Every",
+        description="Save the .blend file after this many batch actions (0 disables checkpoints). "
+                    "In Overwrite Source mode this saves modified sources over the file",
+        default=0, min=0
+    )
     bpy.utils.register_class(RMT_ActionItem)
     bpy.types.Scene.rmt_action_items = bpy.props.CollectionProperty(type=RMT_ActionItem)
+    bpy.types.Scene.rmt_action_items_index = bpy.props.IntProperty()
+    # Rig the action picker list was built for, the list is rebuilt when it changes
+    bpy.types.Scene.rmt_action_items_rig = bpy.props.StringProperty()
+    bpy.types.Scene.rmt_action_pattern = bpy.props.StringProperty(
+        name="Pattern",
+        description="Regular expression searched in action names"
+    )
     bpy.types.Scene.rmt_batch_actions = bpy.props.CollectionProperty(type=RMT_ActionItem)
 
 
@@ -51,8 +149,22 @@ def unregister():
     del bpy.types.Scene.rmt_torso_controller_enum
     del bpy.types.Scene.rmt_root_controller_name
     del bpy.types.Scene.keep_in_world_origin
+    del bpy.types.Scene.rmt_output_mode
+    del bpy.types.Scene.rmt_output_prefix
+    del bpy.types.Scene.rmt_output_suffix
+    del bpy.types.Scene.rmt_verify_transfer
+    del bpy.types.Scene.rmt_verify_location_tolerance
+    del bpy.types.Scene.rmt_verify_rotation_tolerance
+    del bpy.types.Scene.rmt_checkpoint_interval
     # del bpy.types.Scene.rmt_selected_actions
     del bpy.types.Scene.rmt_batch_actions
     del bpy.types.Scene.rmt_action_items
+    del bpy.types.Scene.rmt_action_items_index
+    del bpy.types.Scene.rmt_action_items_rig
+    del bpy.types.Scene.rmt_action_pattern
     bpy.utils.unregister_class(RMT_ActionItem)
     bpy.utils.unregister_class(RMT_ControllerItem)
+    for handlers in _controller_index_handlers:
+        if _invalidate_controller_index_handler in handlers:
+            handlers.remove(_invalidate_controller_index_handler)
+    invalidate_controller_index()
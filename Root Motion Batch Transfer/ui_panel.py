@@ -1,9 +1,66 @@
 import bpy
+import re
+import time
+from .operators import OUTPUT_SOURCE_KEY, LAST_TRANSFERRED_KEY, last_run
 
-class RMT_ActionItem(bpy.types.PropertyGroup):
-    name: bpy.props.StringProperty(name="Action Name")
-    action: bpy.props.PointerProperty(type=bpy.types.Action)
-    is_selected: bpy.props.BoolProperty(name="Select", default=False)
+# Controller list, only visible rows are drawn
+class RMT_UL_Controllers(bpy.types.UIList):
+    bl_idname = "RMT_UL_controllers"
+
+    def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
+        row = layout.row(align=True)
+        row.label(text=item.name, icon='BONE_DATA')
+        op = row.operator("rmt.remove_controller", text="", icon='X', emboss=False)
+        op.index = index
+
+# Action picker of the batch popup, filters and sorts without drawing hidden rows
+class RMT_UL_ActionPicker(bpy.types.UIList):
+    bl_idname = "RMT_UL_action_picker"
+
+    sort_by: bpy.props.EnumProperty(
+        name="Sort By",
+        items=[
+            ('NAME', "Name", "Sort by action name"),
+            ('LENGTH', "Frame Length", "Sort by action frame length"),
+            ('LAST_TRANSFERRED', "Last Transferred", "Sort by last transfer time"),
+        ],
+        default='NAME'
+    )
+
+    def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
+        row = layout.row(align=True)
+        row.prop(item, "is_selected", text="")
+        row.label(text=item.name, icon='ACTION')
+
+        sub = row.row(align=True)
+        sub.alignment = 'RIGHT'
+        sub.label(text=f"{item.frame_length:.0f} f")
+        if item.last_transferred:
+            sub.label(text=time.strftime("%m-%d %H:%M", time.localtime(item.last_transferred)), icon='CHECKMARK')
+
+    def draw_filter(self, context, layout):
+        row = layout.row(align=True)
+        row.prop(self, "filter_name", text="")
+        row.prop(self, "use_filter_invert", text="", icon='ARROW_LEFTRIGHT')
+
+        row = layout.row(align=True)
+        row.prop(self, "sort_by", text="")
+        row.prop(self, "use_filter_sort_reverse", text="", icon='SORT_DESC' if self.use_filter_sort_reverse else 'SORT_ASC')
+
+    def filter_items(self, context, data, propname):
+        items = getattr(data, propname)
+
+        # Empty lists mean all items shown in collection order
+        flt_flags = []
+        if self.filter_name:
+            flt_flags = bpy.types.UI_UL_list.filter_items_by_name(self.filter_name, self.bitflag_filter_item, items, "name")
+
+        # Orders are built once per refresh, not on every redraw
+        orders = _action_sort_orders.get(data.as_pointer())
+        if orders is None or orders["count"] != len(items):
+            return flt_flags, []
+
+        return flt_flags, orders[self.sort_by]
 
 # Main Panel
 class RMT_PT_RootMotionPanel(bpy.types.Panel):
@@ -22,17 +79,13 @@ class RMT_PT_RootMotionPanel(bpy.types.Panel):
 
         row = layout.row(align=True)
         row.operator("rmt.add_controller", text="Add Controllers", icon='PLUS')
+        row.operator("rmt.add_controllers_by_pattern", text="By Pattern", icon='VIEWZOOM')
 
         row = layout.row(align=True)
         row.operator("rmt.clear_controllers", text="Clear All", icon='TRASH')
         row.operator("rmt.select_all_controllers", text="Select All", icon='RESTRICT_SELECT_OFF')
 
-        box = layout.box()
-        for index, item in enumerate(scene.controllers):
-            row = box.row(align=True)
-            row.label(text=item.name, icon='BONE_DATA')
-            op = row.operator("rmt.remove_controller", text="", icon='X')
-            op.index = index
+        layout.template_list("RMT_UL_controllers", "", scene, "controllers", scene, "controllers_index", rows=5)
 
         col = layout.column(align=True)
         col.label(text="Target Controller (usually torso - COG):")
@@ -61,12 +114,33 @@ class RMT_PT_RootMotionPanel(bpy.types.Panel):
             subrow.prop(scene, "axis_y", text="Y") 
             subrow.prop(scene, "axis_z", text="Z")
 
+        col = layout.column(align=True)
+        col.prop(scene, "rmt_output_mode")
+        if scene.rmt_output_mode == 'NEW_ACTION':
+            row = col.row(align=True)
+            row.prop(scene, "rmt_output_prefix")
+            row.prop(scene, "rmt_output_suffix")
+
+        row = layout.row(align=True)
+        row.label(text="Verify Transfer")
+        row.prop(scene, "rmt_verify_transfer", text="")
+
+        if scene.rmt_verify_transfer:
+            col = layout.column(align=True)
+            col.prop(scene, "rmt_verify_location_tolerance", text="Location")
+            col.prop(scene, "rmt_verify_rotation_tolerance", text="Rotation")
+
         col = layout.column(align=True)
         col.scale_y = 1
         col.operator("rmt.transfer_root_motion", text="Transfer Root Motion", icon='PLAY')
 
         layout.operator("rmt.batch_transfer_root_motion", icon="ACTION")
 
+        row = layout.row(align=True)
+        row.prop(scene, "rmt_checkpoint_interval")
+        row.operator("rmt.resume_batch_transfer", text="Resume", icon='RECOVER_LAST')
+        row.operator("rmt.discard_batch_manifest", text="", icon='TRASH')
+
 # Popup Panel for Batch transfer
 class RMT_OT_SelectActionsPopup(bpy.types.Operator):
     bl_idname = "rmt.batch_transfer_root_motion"
@@ -77,18 +151,12 @@ class RMT_OT_SelectActionsPopup(bpy.types.Operator):
     def invoke(self, context, event):
         rig = context.scene.rmt_selected_rig
         scene = context.scene
-        scene.rmt_action_items.clear()
 
         if not rig or rig.type != 'ARMATURE':
             self.report({'WARNING'}, "No rig selected.")
             return {'CANCELLED'}
 
-        for act in bpy.data.actions:
-            if act.users > 0 and action_contains_rig_animation(act, rig):
-                item = scene.rmt_action_items.add()
-                item.name = act.name
-                item.action = act
-                item.is_selected = False
+        refresh_action_items(scene, rig)
 
         return context.window_manager.invoke_props_dialog(self, width=400)
 
@@ -97,8 +165,16 @@ class RMT_OT_SelectActionsPopup(bpy.types.Operator):
         scene = context.scene
         layout.label(text="Select actions to process:", icon='ACTION')
 
-        for item in scene.rmt_action_items:
-            layout.prop(item, "is_selected", text=item.name)
+        row = layout.row(align=True)
+        row.prop(scene, "rmt_action_pattern", text="", icon='VIEWZOOM')
+        op = row.operator("rmt.select_actions_by_pattern", text="Select")
+        op.pattern = scene.rmt_action_pattern
+        op.select = True
+        op = row.operator("rmt.select_actions_by_pattern", text="Deselect")
+        op.pattern = scene.rmt_action_pattern
+        op.select = False
+
+        layout.template_list("RMT_UL_action_picker", "", scene, "rmt_action_items", scene, "rmt_action_items_index", rows=12)
 
     def execute(self, context):
         selected = [item.action for item in context.scene.rmt_action_items if item.is_selected]
@@ -117,12 +193,127 @@ class RMT_OT_SelectActionsPopup(bpy.types.Operator):
             item.action = action
         
         # Call the batch transfer operator
-        bpy.ops.rmt.batch_transfer_root_motion_continue()
+        result = bpy.ops.rmt.batch_transfer_root_motion_continue()
+        if result != {'FINISHED'}:
+            return {'CANCELLED'}
+
+        if last_run["failed_actions"]:
+            self.report({'ERROR'}, f"Batch transfer failed for {len(last_run['failed_actions'])} actions, see console for details.")
+            return {'FINISHED'}
     
         self.report({'INFO'}, f"Transfered {len(selected)} actions: {', '.join([act.name for act in selected])}")     
         return {'FINISHED'}
 
-# --- Helper function, only call in RMT_PT_SelectActionsPanel ---
+class RMT_OT_SelectActionsByPattern(bpy.types.Operator):
+    bl_idname = "rmt.select_actions_by_pattern"
+    bl_label = "Select Actions by Pattern"
+    bl_description = "Select or deselect every listed action whose name matches the pattern (empty matches all)"
+    bl_options = {'INTERNAL'}
+
+    pattern: bpy.props.StringProperty(name="Pattern")
+    select: bpy.props.BoolProperty(name="Select", default=True)
+
+    def execute(self, context):
+        try:
+            regex = re.compile(self.pattern)
+        except re.error as err:
+            self.report({'ERROR'}, f"Invalid pattern '{self.pattern}': {err}")
+            return {'CANCELLED'}
+
+        for item in context.scene.rmt_action_items:
+            if regex.search(item.name):
+                item.is_selected = self.select
+
+        return {'FINISHED'}
+
+# --- Helper functions, only call in RMT_OT_SelectActionsPopup ---
+# Sort orders of scene.rmt_action_items for RMT_UL_ActionPicker, keyed by scene pointer
+_action_sort_orders = {}
+
+def build_sort_orders(names, lengths, stamps):
+    """
+    Returns: dict mapping each RMT_UL_ActionPicker sort mode to its flt_neworder, empty if the order is unchanged.
+    """
+    helper = bpy.types.UI_UL_list
+    orders = {
+        'NAME': helper.sort_items_helper(list(enumerate(names)), key=lambda e: e[1].lower()),
+        'LENGTH': helper.sort_items_helper(list(enumerate(lengths)), key=lambda e: e[1]),
+        'LAST_TRANSFERRED': helper.sort_items_helper(list(enumerate(stamps)), key=lambda e: e[1]),
+    }
+    for sort_by, order in orders.items():
+        if order == list(range(len(order))):
+            orders[sort_by] = []
+
+    orders["count"] = len(names)
+    return orders
+
+def refresh_action_items(scene, rig):
+    """
+    Updates scene.rmt_action_items in place: removes deleted or unused actions and adds new actions animating
+    the rig. Only new actions are scanned for rig animation, and only new, renamed or re-transferred rows are
+    written. Selections are cleared, as every open starts empty. Also rebuilds the picker sort orders.
+    """
+    items = scene.rmt_action_items
+
+    # Relevance depends on the rig, start over when it changes
+    if scene.rmt_action_items_rig != rig.name:
+        items.clear()
+        scene.rmt_action_items_rig = rig.name
+
+    # Outputs of previous transfers are not listed, their transfer time counts for their source
+    last_transferred = {}
+    for act in bpy.data.actions:
+        stamp = act.get(LAST_TRANSFERRED_KEY, 0.0)
+        if OUTPUT_SOURCE_KEY in act:
+            if not act[OUTPUT_SOURCE_KEY]:
+                continue
+            source_name = act[OUTPUT_SOURCE_KEY].name
+        else:
+            source_name = act.name
+        if stamp > last_transferred.get(source_name, 0.0):
+            last_transferred[source_name] = stamp
+
+    listed = set()
+    for index in reversed(range(len(items))):
+        item = items[index]
+        act = item.action
+        if not act or act.users == 0 or OUTPUT_SOURCE_KEY in act:
+            items.remove(index)
+            continue
+
+        listed.add(act.name)
+
+        # Never carry ticks over, one OK click would transfer already transferred actions again
+        if item.is_selected:
+            item.is_selected = False
+        if item.name != act.name:
+            item.name = act.name
+
+        # A transfer rebakes the action, so its length only changes along with its stamp
+        stamp = last_transferred.get(act.name, 0.0)
+        if item.last_transferred != stamp:
+            item.last_transferred = stamp
+            item.frame_length = act.frame_range[1] - act.frame_range[0]
+
+    for act in bpy.data.actions:
+        if act.name in listed or OUTPUT_SOURCE_KEY in act:
+            continue
+        if act.users > 0 and action_contains_rig_animation(act, rig):
+            item = items.add()
+            item.action = act
+            item.name = act.name
+            item.frame_length = act.frame_range[1] - act.frame_range[0]
+            item.last_transferred = last_transferred.get(act.name, 0.0)
+
+    names, lengths, stamps = [], [], []
+    for item in items:
+        names.append(item.name)
+        lengths.append(item.frame_length)
+        stamps.append(item.last_transferred)
+    _action_sort_orders[scene.as_pointer()] = build_sort_orders(names, lengths, stamps)
+
+    scene.rmt_action_items_index = min(scene.rmt_action_items_index, max(len(items) - 1, 0))
+
 def action_contains_rig_animation(action, rig):
     """
     Checks if the given action contains animation data for the specified rig's pose bones. We dont wanna bake not relate action.
@@ -138,15 +329,15 @@ def action_contains_rig_animation(action, rig):
     return False
 
 def register():
-    bpy.utils.register_class(RMT_ActionItem)
+    bpy.utils.register_class(RMT_UL_Controllers)
+    bpy.utils.register_class(RMT_UL_ActionPicker)
+    bpy.utils.register_class(RMT_OT_SelectActionsByPattern)
     bpy.utils.register_class(RMT_OT_SelectActionsPopup)
     bpy.utils.register_class(RMT_PT_RootMotionPanel)
-    bpy.types.Scene.rmt_batch_actions = bpy.props.CollectionProperty(type=RMT_ActionItem)
-    bpy.types.Scene.rmt_action_items = bpy.props.CollectionProperty(type=RMT_ActionItem)
 
 def unregister():
-    del bpy.types.Scene.rmt_batch_actions
-    del bpy.types.Scene.rmt_action_items
     bpy.utils.unregister_class(RMT_PT_RootMotionPanel)
     bpy.utils.unregister_class(RMT_OT_SelectActionsPopup)
-    bpy.utils.unregister_class(RMT_ActionItem)
+    bpy.utils.unregister_class(RMT_OT_SelectActionsByPattern)
+    bpy.utils.unregister_class(RMT_UL_ActionPicker)
+    bpy.utils.unregister_class(RMT_UL_Controllers)